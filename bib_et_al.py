@@ -22,6 +22,16 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 import re
 
+from strip_bib_urls import find_matching_brace, find_matching_quote
+
+# 'author = {' or 'author = "' at a field-name boundary; group 1 is the delimiter.
+_AUTHOR_RE = re.compile(r'(?<![A-Za-z0-9_\\])author\s*=\s*([{"])', re.IGNORECASE)
+_OTHERS_RE = re.compile(r"\band\s+others\b", re.IGNORECASE)
+# 'and' delimited by whitespace or the ends of the string.
+_AND_RE = re.compile(r'(?<!\S)and(?!\S)', re.IGNORECASE)
+# Braces and 'and' separators, the only positions split_authors_top_level acts on.
+_SPLIT_TOKEN_RE = re.compile(r'[{}]|(?<!\S)and(?!\S)', re.IGNORECASE)
+
 
 def compute_output_path(input_path: Path) -> Path:
     """Insert _et_al before the .bib suffix; if no .bib suffix, append _et_al.bib."""
@@ -30,13 +40,6 @@ def compute_output_path(input_path: Path) -> Path:
     return input_path.with_name(f"{input_path.name}_et_al.bib")
 
 
-def is_word_boundary(prev_char: Optional[str]) -> bool:
-    """True if prev_char is None or not alphanumeric or underscore."""
-    if prev_char is None:
-        return True
-    return not (prev_char.isalnum() or prev_char == "_")
-
-
 def find_next_author_field(content: str, start_index: int) -> Optional[Tuple[int, int, int, str, str]]:
     """
     Find the next author field starting at start_index.
@@ -50,78 +53,26 @@ def find_next_author_field(content: str, start_index: int) -> Optional[Tuple[int
 
     If not found, returns None.
     """
-    needle = "author"
-    n = len(content)
-    pos = start_index
-    lower_content = content.lower()
-
-    while True:
-        idx = lower_content.find(needle, pos)
-        if idx == -1:
-            return None
-
-        prev_char = None if idx == 0 else content[idx - 1]
-        if not is_word_boundary(prev_char):
-            pos = idx + 1
-            continue
-
-        j = idx + len(needle)
-        # Skip whitespace
-        while j < n and content[j].isspace():
-            j += 1
-
-        if j >= n or content[j] != '=':
-            pos = idx + 1
-            continue
-
-        j += 1  # Skip '='
-        while j < n and content[j].isspace():
-            j += 1
-
-        if j >= n:
-            return None
+    match = _AUTHOR_RE.search(content, start_index)
+    if match is None:
+        return None
 
-        delimiter = content[j]
-        if delimiter not in ('{', '"'):
-            # Non-braced/quoted value (e.g., macro); skip conservatively
-            pos = idx + 1
-            continue
+    field_start = match.start()
+    delimiter = match.group(1)
+    value_start = match.end()
+
+    if delimiter == '{':
+        # Matching closing brace, respecting nesting
+        value_end = find_matching_brace(content, value_start - 1)
+    else:
+        # Next unescaped quote
+        value_end = find_matching_quote(content, value_start - 1)
+    if value_end is None:
+        # Unbalanced value; treat as not found
+        return None
 
-        value_start = j + 1
-
-        if delimiter == '{':
-            # Parse until matching closing brace with nesting
-            level = 1
-            k = value_start
-            while k < n:
-                c = content[k]
-                if c == '{':
-                    level += 1
-                elif c == '}':
-                    level -= 1
-                    if level == 0:
-                        value_end = k
-                        value = content[value_start:value_end]
-                        return (idx, value_start, value_end, delimiter, value)
-                k += 1
-            # Unbalanced braces; treat as not found
-            return None
-        else:
-            # delimiter == '"': parse until next unescaped quote
-            k = value_start
-            escaped = False
-            while k < n:
-                c = content[k]
-                if c == '"' and not escaped:
-                    value_end = k
-                    value = content[value_start:value_end]
-                    return (idx, value_start, value_end, delimiter, value)
-                if c == '\\' and not escaped:
-                    escaped = True
-                else:
-                    escaped = False
-                k += 1
-            return None
+    value = content[value_start:value_end]
+    return (field_start, value_start, value_end, delimiter, value)
 
 
 def split_authors_top_level(author_value: str) -> List[str]:
@@ -129,52 +80,29 @@ def split_authors_top_level(author_value: str) -> List[str]:
     Split the author field string into individual authors on top-level ' and ' boundaries.
     Respects brace nesting to avoid splitting inside grouped parts of names.
     """
+    if '{' not in author_value:
+        # No groups to respect, so every 'and' is a top-level separator.
+        stripped = (part.strip() for part in _AND_RE.split(author_value))
+        return [author for author in stripped if author]
+
     authors: List[str] = []
-    buffer: List[str] = []
+    segment_start = 0
     level = 0
-    i = 0
     s = author_value
-    length = len(s)
-
-    def matches_and_at(index: int) -> int:
-        # Check for 'and' with whitespace boundaries, case-insensitive
-        if index + 3 > length:
-            return 0
-        segment = s[index:index + 3].lower()
-        if segment != 'and':
-            return 0
-        prev_ok = (index == 0) or s[index - 1].isspace()
-        next_ok = (index + 3 >= length) or s[index + 3].isspace()
-        return 3 if prev_ok and next_ok else 0
-
-    while i < length:
-        c = s[i]
-        if c == '{':
+
+    for token in _SPLIT_TOKEN_RE.finditer(s):
+        t = token.group()
+        if t == '{':
             level += 1
-            buffer.append(c)
-            i += 1
-            continue
-        if c == '}':
+        elif t == '}':
             level = max(0, level - 1)
-            buffer.append(c)
-            i += 1
-            continue
-        if level == 0:
-            m = matches_and_at(i)
-            if m:
-                author = ''.join(buffer).strip()
-                if author:
-                    authors.append(author)
-                buffer = []
-                i += m
-                # Consume any additional whitespace after 'and'
-                while i < length and s[i].isspace():
-                    i += 1
-                continue
-        buffer.append(c)
-        i += 1
-
-    tail = ''.join(buffer).strip()
+        elif level == 0:
+            author = s[segment_start:token.start()].strip()
+            if author:
+                authors.append(author)
+            segment_start = token.end()
+
+    tail = s[segment_start:].strip()
     if tail:
         authors.append(tail)
 
@@ -182,7 +110,7 @@ def split_authors_top_level(author_value: str) -> List[str]:
 
 
 def author_already_others(author_value: str) -> bool:
-    return re.search(r"\band\s+others\b", author_value, flags=re.IGNORECASE) is not None
+    return _OTHERS_RE.search(author_value) is not None
 
 
 def transform_author_value_if_needed(author_value: str) -> Optional[str]:
@@ -193,6 +121,11 @@ def transform_author_value_if_needed(author_value: str) -> Optional[str]:
     if author_already_others(author_value):
         return None
 
+    # Every top-level separator is an 'and' match, so fewer than three matches
+    # means at most three authors and the value can be skipped without splitting.
+    if len(_AND_RE.findall(author_value)) < 3:
+        return None
+
     authors = split_authors_top_level(author_value)
     if len(authors) <= 3:
         return None
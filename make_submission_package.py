@@ -4,15 +4,27 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import os
 import re
 import shutil
 import sys
-from collections import OrderedDict
+import unicodedata
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, FrozenSet, Iterable, List, Sequence
 
 GRAPHIC_EXTENSIONS: Sequence[str] = (".pdf", ".png", ".jpg", ".jpeg", ".eps")
 
+_INCLUDEGRAPHICS_RE = re.compile(r"\\includegraphics(?:\s*\[[^\]]*\])?\s*{([^}]*)}")
+_GRAPHICSPATH_RE = re.compile(r"\\graphicspath{([^}]*)}")
+_INNER_BRACE_RE = re.compile(r"{([^{}]+)}")
+_BIB_RE = re.compile(r"\\bibliography{([^}]*)}")
+_DOCCLASS_RE = re.compile(r"\\documentclass(?:\[[^\]]*\])?{([^}]*)}")
+# The first '%' on a line that is not part of a backslash escape starts a comment
+# running to the end of the line; group 1 keeps the text before it.
+_COMMENT_RE = re.compile(r"^([^%\\\n]*(?:\\.[^%\\\n]*)*)%.*", re.MULTILINE)
+_TRAILING_WS_RE = re.compile(r"(?<![^\S\n])[^\S\n]+$", re.MULTILINE)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -30,50 +42,22 @@ def parse_args() -> argparse.Namespace:
 
 
 def unique(items: Iterable[str]) -> List[str]:
-    return list(OrderedDict.fromkeys(items))
+    return list(dict.fromkeys(items))
 
 
 def strip_latex_comments(text: str) -> str:
-    def strip_line(line: str) -> str:
-        newline = ""
-        if line.endswith("\n"):
-            newline = "\n"
-            line = line[:-1]
-
-        result: List[str] = []
-        i = 0
-        while i < len(line):
-            ch = line[i]
-            if ch == "%":
-                backslash_count = 0
-                j = i - 1
-                while j >= 0 and line[j] == "\\":
-                    backslash_count += 1
-                    j -= 1
-                if backslash_count % 2 == 1:
-                    result.append("%")
-                    i += 1
-                    continue
-                break
-            result.append(ch)
-            i += 1
-
-        stripped = "".join(result).rstrip()
-        return (stripped + newline) if stripped else newline
-
-    return "".join(strip_line(line) for line in text.splitlines(True))
+    without_comments = _COMMENT_RE.sub(r"\1", text)
+    return _TRAILING_WS_RE.sub("", without_comments)
 
 
 def extract_includegraphics_paths(text: str) -> List[str]:
-    pattern = re.compile(r"\\includegraphics(?:\s*\[[^\]]*\])?\s*{([^}]*)}")
-    return unique(match.group(1).strip() for match in pattern.finditer(text))
+    return unique(match.group(1).strip() for match in _INCLUDEGRAPHICS_RE.finditer(text))
 
 
 def extract_graphic_search_dirs(text: str) -> List[str]:
-    pattern = re.compile(r"\\graphicspath{([^}]*)}")
     dirs: List[str] = []
-    for group in pattern.findall(text):
-        for entry in re.findall(r"{([^{}]+)}", group):
+    for group in _GRAPHICSPATH_RE.findall(text):
+        for entry in _INNER_BRACE_RE.findall(group):
             cleaned = entry.strip()
             if cleaned:
                 dirs.append(cleaned)
@@ -81,9 +65,8 @@ def extract_graphic_search_dirs(text: str) -> List[str]:
 
 
 def extract_bibliography_files(text: str) -> List[str]:
-    pattern = re.compile(r"\\bibliography{([^}]*)}")
     bibs: List[str] = []
-    for grp in pattern.findall(text):
+    for grp in _BIB_RE.findall(text):
         for entry in grp.split(","):
             cleaned = entry.strip()
             if cleaned:
@@ -92,19 +75,46 @@ def extract_bibliography_files(text: str) -> List[str]:
 
 
 def extract_document_classes(text: str) -> List[str]:
-    pattern = re.compile(r"\\documentclass(?:\[[^\]]*\])?{([^}]*)}")
     classes = []
-    for cls in pattern.findall(text):
+    for cls in _DOCCLASS_RE.findall(text):
         name = cls.strip()
         if name:
             classes.append(name)
     return unique(classes)
 
 
+def _fold_name(name: str) -> str:
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_index(directory: Path) -> FrozenSet[str] | None:
+    """Folded names of the existing entries in directory.
+
+    Empty if directory does not exist or is not a directory; None if it cannot be
+    listed for any other reason.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(_fold_name(e.name) for e in entries if e.is_file() or e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    except OSError:
+        return None
+
+
 def resolve_graphic_path(tex_dir: Path, graphic: str, extra_dirs: Sequence[str]) -> Path:
     raw_path = Path(graphic).expanduser()
     candidates: List[Path] = []
 
+    def exists(path: Path) -> bool:
+        # The listing only rules candidates out; whether a name that matches up to
+        # case is the same file is left to the filesystem, as LaTeX does.
+        names = _dir_index(path.parent)
+        if names is not None and _fold_name(path.name) not in names:
+            return False
+        return path.exists()
+
     if raw_path.is_absolute():
         candidates.append(raw_path)
     else:
@@ -122,14 +132,14 @@ def resolve_graphic_path(tex_dir: Path, graphic: str, extra_dirs: Sequence[str])
             continue
         seen.add(candidate)
         if candidate.suffix:
-            if candidate.exists():
+            if exists(candidate):
                 return candidate
         else:
             for ext in GRAPHIC_EXTENSIONS:
                 alt = candidate.with_suffix(ext)
-                if alt.exists():
+                if exists(alt):
                     return alt
-        if candidate.exists():
+        if exists(candidate):
             return candidate
     raise FileNotFoundError(f"Figure '{graphic}' not found relative to {tex_dir}")
 
@@ -139,12 +149,16 @@ def copy_file(src: Path, dest: Path) -> None:
     shutil.copy2(src, dest)
 
 
-def locate_case_insensitive(root: Path, filename: str) -> Path | None:
-    target = filename.lower()
+@functools.lru_cache(maxsize=4)
+def _cls_index(root: Path) -> Dict[str, Path]:
+    index: Dict[str, Path] = {}
     for path in root.rglob("*.cls"):
-        if path.name.lower() == target:
-            return path
-    return None
+        index.setdefault(path.name.lower(), path)
+    return index
+
+
+def locate_case_insensitive(root: Path, filename: str) -> Path | None:
+    return _cls_index(root).get(filename.lower())
 
 
 def main() -> None:
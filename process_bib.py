@@ -4,12 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import re
 import sys
 from pathlib import Path
-from typing import Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from bib_et_al import process_bibtex
-from strip_bib_urls import strip_url_fields
+from bib_et_al import transform_author_value_if_needed
+from strip_bib_urls import compute_field_bounds, find_value_end
+
+# An author or url field name followed by '='; group 1 is set for author fields.
+_FIELD_RE = re.compile(r"(?<![A-Za-z0-9_\\])(?:(author)|url)\s*=\s*", re.IGNORECASE)
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -38,11 +42,61 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 
 
 def clean_bib_content(content: str) -> Tuple[str, int, int]:
-    """Apply url stripping first, then author compaction."""
-
-    without_urls, urls_removed = strip_url_fields(content)
-    cleaned_authors, authors_modified = process_bibtex(without_urls)
-    return cleaned_authors, urls_removed, authors_modified
+    """Strip url fields and collapse long author lists in a single scan.
+
+    Both rewrites go into one output buffer, so no url-stripped intermediate
+    copy of the text is built. Url fields inside an author value are kept.
+    """
+
+    pieces: List[str] = []
+    cursor = 0
+    pos = 0
+    urls_removed = 0
+    authors_modified = 0
+    scan_authors = True
+
+    while True:
+        match = _FIELD_RE.search(content, pos)
+        if match is None:
+            break
+        field_index = match.start()
+
+        if match.group(1) is None:
+            bounds = compute_field_bounds(content, field_index)
+            if bounds is None:
+                pos = field_index + 1
+                continue
+            start, end = bounds
+            pieces.append(content[cursor:max(start, cursor)])
+            cursor = end
+            pos = end
+            urls_removed += 1
+            continue
+
+        value_start = match.end()
+        if not scan_authors or content[value_start:value_start + 1] not in ('{', '"'):
+            # Non-braced/quoted value (e.g., macro); skip conservatively
+            pos = field_index + 1
+            continue
+
+        value_end = find_value_end(content, value_start)
+        if value_end is None:
+            # Unbalanced value; like process_bibtex, stop rewriting authors
+            scan_authors = False
+            pos = field_index + 1
+            continue
+        value_end -= 1
+
+        replacement_value = transform_author_value_if_needed(content[value_start + 1:value_end])
+        if replacement_value is not None:
+            pieces.append(content[cursor:value_start + 1])
+            pieces.append(replacement_value)
+            cursor = value_end
+            authors_modified += 1
+        pos = value_end + 1
+
+    pieces.append(content[cursor:])
+    return "".join(pieces), urls_removed, authors_modified
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -4,10 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import re
+import string
 import sys
 from pathlib import Path
 from typing import List, Optional, Sequence, Tuple
 
+# 'url' followed by '='; compute_field_bounds checks the field-name boundary. A
+# leading lookbehind here would stop SRE from skipping ahead to 'url' candidates.
+_URL_RE = re.compile(r"url(?=\s*=)", re.IGNORECASE)
+# Characters that may appear in a BibTeX field name.
+_FIELDCHAR = frozenset(string.ascii_letters + string.digits + "_")
+_BRACE_RE = re.compile(r"[{}]")
+_WS_RE = re.compile(r"\s*")
+_BLANK_RE = re.compile(r"[ \t]*")
+# Body of a quoted value up to and including the first unescaped closing quote.
+_QUOTE_END_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -60,15 +73,14 @@ def strip_url_fields(content: str) -> Tuple[str, int]:
 
 
 def locate_url_field_ranges(text: str) -> List[Tuple[int, int]]:
-    lower = text.lower()
     idx = 0
     ranges: List[Tuple[int, int]] = []
-    length = len(text)
 
-    while idx < length:
-        candidate = lower.find("url", idx)
-        if candidate == -1:
+    while True:
+        match = _URL_RE.search(text, idx)
+        if match is None:
             break
+        candidate = match.start()
         bounds = compute_field_bounds(text, candidate)
         if bounds is None:
             idx = candidate + 1
@@ -87,14 +99,10 @@ def compute_field_bounds(text: str, field_index: int) -> Optional[Tuple[int, int
         return None
 
     n = len(text)
-    j = field_index + 3
-    while j < n and text[j].isspace():
-        j += 1
+    j = _WS_RE.match(text, field_index + 3).end()
     if j >= n or text[j] != '=':
         return None
-    j += 1
-    while j < n and text[j].isspace():
-        j += 1
+    j = _WS_RE.match(text, j + 1).end()
     if j >= n:
         return None
 
@@ -103,15 +111,11 @@ def compute_field_bounds(text: str, field_index: int) -> Optional[Tuple[int, int
     if value_end is None:
         return None
 
-    end = value_end
     # Skip spaces/tabs before the optional comma.
-    while end < n and text[end] in ' \t':
-        end += 1
+    end = _BLANK_RE.match(text, value_end).end()
 
     if end < n and text[end] == ',':
-        end += 1
-        while end < n and text[end] in ' \t':
-            end += 1
+        end = _BLANK_RE.match(text, end + 1).end()
         end = consume_linebreak(text, end)
     else:
         end = consume_linebreak(text, end)
@@ -155,14 +159,13 @@ def consume_linebreak(text: str, pos: int) -> int:
 def is_field_name(text: str, index: int, length: int) -> bool:
     """True if text[index:index+length] forms a standalone field name."""
 
-    before = text[index - 1] if index > 0 else None
-    if before is not None and (before.isalnum() or before == '_' or before == '\\'):
-        return False
-    after_index = index + length
-    if after_index < len(text):
-        after = text[after_index]
-        if after.isalnum() or after == '_':
+    if index > 0:
+        before = text[index - 1]
+        if before in _FIELDCHAR or before == '\\':
             return False
+    after_index = index + length
+    if after_index < len(text) and text[after_index] in _FIELDCHAR:
+        return False
     return True
 
 
@@ -215,34 +218,19 @@ def find_value_end(text: str, start: int) -> Optional[int]:
 
 def find_matching_brace(text: str, open_index: int) -> Optional[int]:
     depth = 1
-    i = open_index + 1
-    n = len(text)
-    while i < n:
-        c = text[i]
-        if c == '{':
+    for brace in _BRACE_RE.finditer(text, open_index + 1):
+        if brace.group() == '{':
             depth += 1
-        elif c == '}':
+        else:
             depth -= 1
             if depth == 0:
-                return i
-        i += 1
+                return brace.start()
     return None
 
 
 def find_matching_quote(text: str, open_index: int) -> Optional[int]:
-    i = open_index + 1
-    n = len(text)
-    escaped = False
-    while i < n:
-        c = text[i]
-        if c == '"' and not escaped:
-            return i
-        if c == '\\' and not escaped:
-            escaped = True
-        else:
-            escaped = False
-        i += 1
-    return None
+    match = _QUOTE_END_RE.match(text, open_index + 1)
+    return match.end() - 1 if match is not None else None
 
 
 def main(argv: Optional[Sequence[str]] = None) -> None: